@@ -1,7 +1,9 @@
+import re
+from asyncio import CancelledError
 from logging import Logger
-from unittest.mock import AsyncMock, MagicMock, Mock, call
+from unittest.mock import AsyncMock, Mock, call
 
-from pytest import fixture, mark
+from pytest import fixture, mark, raises
 
 from xiao_asgi.applications import Xiao
 from xiao_asgi.routing import HttpRoute, Route
@@ -34,12 +36,56 @@ class TestXiao:
 
     def test_create_without_routes(self):
         app = Xiao()
-        assert app._routes == []
+        assert app._routes == ()
 
     def test_create_with_routes(self, routes):
         app = Xiao(routes)
         assert isinstance(app.logger, Logger)
-        assert app._routes == routes
+        assert app._routes == tuple(routes)
+
+    def test_static_and_dynamic_routes_partitioned(self):
+        static_route = HttpRoute("/about")
+        dynamic_route = HttpRoute("/post/{id}")
+        shadowed_route = HttpRoute("/post/latest")
+
+        app = Xiao([static_route, dynamic_route, shadowed_route])
+
+        assert app._static_routes == {"/about": static_route}
+        assert len(app._path_regexes) == 1
+        assert app._path_regexes[0][1] == {
+            1: (dynamic_route, (("id", 1),)),
+            3: (shadowed_route, ()),
+        }
+
+    async def test_static_route_called_without_regex_match(self, scope):
+        route = AsyncMock()
+        route.path = "/"
+        route.path_regex = Mock(pattern="^/$", flags=re.UNICODE)
+
+        app = Xiao([route])
+
+        await app(scope, AsyncMock(), AsyncMock())
+
+        route.path_regex.match.assert_not_called()
+        assert route.call_args.args[0].path_parameters == {}
+
+    async def test_route_with_custom_compile_path_not_static(self, scope):
+        class SlashRoute(HttpRoute):
+            @staticmethod
+            def compile_path(path):
+                return re.compile(f"^{re.escape(path)}/?$")
+
+        scope["path"] = "/about/"
+        send = AsyncMock()
+        route = SlashRoute("/about")
+
+        receive = AsyncMock(return_value={"type": "http.request"})
+
+        app = Xiao([route])
+        await app(scope, receive, send)
+
+        assert app._static_routes == {}
+        assert send.await_args_list[0].args[0]["status"] == 405
 
     async def test_calling_with_unknown_endpoint(self, app, scope):
         scope["path"] = "/invalid"
@@ -69,16 +115,95 @@ class TestXiao:
             ]
         )
 
-    async def test_calling_with_endpoint_error(self, app, scope):
+    async def test_unknown_endpoint_messages_not_shared(self, app, scope):
+        scope["path"] = "/invalid"
+        send = AsyncMock()
+
+        await app(scope, AsyncMock(), send)
+        send.await_args_list[0].args[0]["headers"].append(
+            (b"set-cookie", b"session=alice")
+        )
+        send.await_args_list[1].args[0]["body"] = b""
+        send.reset_mock()
+
+        await app(scope, AsyncMock(), send)
+
+        send.assert_has_awaits(
+            [
+                call(
+                    {
+                        "type": "http.response.start",
+                        "status": 404,
+                        "headers": [
+                            (b"content-length", b"9"),
+                            (b"content-type", b"text/plain; charset=utf-8"),
+                        ],
+                    }
+                ),
+                call(
+                    {
+                        "type": "http.response.body",
+                        "body": b"Not Found",
+                        "more_body": False,
+                    }
+                ),
+            ]
+        )
+
+    async def test_calling_websocket_with_unknown_endpoint(self, app, scope):
+        scope["type"] = "websocket"
+        scope["path"] = "/invalid"
+        send = AsyncMock()
+
+        await app(scope, AsyncMock(), send)
+
+        send.assert_has_awaits(
+            [
+                call(
+                    {
+                        "type": "websocket.http.response.start",
+                        "status": 404,
+                        "headers": [
+                            (b"content-length", b"9"),
+                            (b"content-type", b"text/plain; charset=utf-8"),
+                        ],
+                    }
+                ),
+                call(
+                    {
+                        "type": "websocket.http.response.body",
+                        "body": b"Not Found",
+                        "more_body": False,
+                    }
+                ),
+            ]
+        )
+
+    async def test_calling_with_endpoint_error(self, scope):
+        route = AsyncMock(side_effect=Exception())
+        route.path = "/"
+        route.path_regex = Route.compile_path("/")
+
+        app = Xiao([route])
         app.logger = Mock()
-        app._routes[0] = AsyncMock(side_effect=Exception())
-        app._routes[0].path = "/"
-        app._routes[0].path_regex = Route.compile_path("/")
 
         await app(scope, AsyncMock(), AsyncMock())
 
         app.logger.exception.assert_called_once()
 
+    async def test_calling_with_cancelled_endpoint(self, scope):
+        route = AsyncMock(side_effect=CancelledError())
+        route.path = "/"
+        route.path_regex = Route.compile_path("/")
+
+        app = Xiao([route])
+        app.logger = Mock()
+
+        with raises(CancelledError):
+            await app(scope, AsyncMock(), AsyncMock())
+
+        app.logger.exception.assert_not_called()
+
     async def test_calling_with_no_endpoint_error(self, app, scope):
         send = AsyncMock()
 
@@ -108,13 +233,131 @@ class TestXiao:
             ]
         )
 
-    async def test_path_parameters_passed_to_route(self, app, scope):
+    async def test_path_parameters_passed_to_route(self, scope):
+        scope["path"] = "/post/1"
+        route = AsyncMock()
+        route.path = "/post/{id}"
+        route.path_regex = Route.compile_path("/post/{id}")
+
+        app = Xiao([route])
+
+        await app(scope, AsyncMock(), AsyncMock())
+
+        assert route.call_args.args[0].path_parameters == {"id": "1"}
+
+    async def test_matched_path_remembered(self, scope):
         scope["path"] = "/post/1"
-        route = MagicMock()
+        route = AsyncMock()
+        route.path = "/post/{id}"
+        route.path_regex = Route.compile_path("/post/{id}")
+
+        app = Xiao([route])
+        path_regex = Mock(wraps=app._path_regexes[0][0])
+        app._path_regexes[0] = (path_regex, app._path_regexes[0][1])
+
+        await app(scope, AsyncMock(), AsyncMock())
+        await app(scope, AsyncMock(), AsyncMock())
+
+        path_regex.match.assert_called_once_with("/post/1")
+        assert app._matched_paths == {"/post/1": (route, {"id": "1"})}
+        assert route.call_args.args[0].path_parameters == {"id": "1"}
+
+    async def test_oldest_matched_path_forgotten(self, scope):
+        route = AsyncMock()
+        route.path = "/post/{id}"
         route.path_regex = Route.compile_path("/post/{id}")
 
-        app._routes = [route]
+        app = Xiao([route])
+        app.matched_paths_size = 2
+
+        for path in ("/post/1", "/post/2", "/post/3"):
+            scope["path"] = path
+            await app(scope, AsyncMock(), AsyncMock())
+
+        assert list(app._matched_paths) == ["/post/2", "/post/3"]
+
+    async def test_routes_with_same_path_parameters(self, scope):
+        scope["path"] = "/comment/2/3"
+        post_route = AsyncMock()
+        post_route.path = "/post/{id}"
+        post_route.path_regex = Route.compile_path("/post/{id}")
+        comment_route = AsyncMock()
+        comment_route.path = "/comment/{id}/{reply}"
+        comment_route.path_regex = Route.compile_path("/comment/{id}/{reply}")
+
+        app = Xiao([post_route, comment_route])
+
+        await app(scope, AsyncMock(), AsyncMock())
+
+        post_route.assert_not_awaited()
+        assert comment_route.call_args.args[0].path_parameters == {
+            "id": "2",
+            "reply": "3",
+        }
+
+    @mark.parametrize(
+        "path,parameters",
+        [
+            ("/a/x/1", {"id": "1"}),
+            ("/a/yz/2", {"id": "2"}),
+        ],
+    )
+    async def test_route_with_unnamed_groups(self, scope, path, parameters):
+        scope["path"] = path
+        group_route = AsyncMock()
+        group_route.path = "/a/{id}"
+        group_route.path_regex = re.compile("^/a/(?:x|y)(z)?/(?P<id>[^/]+)$")
+        slug_route = AsyncMock()
+        slug_route.path = "/b/{slug}"
+        slug_route.path_regex = Route.compile_path("/b/{slug}")
+
+        app = Xiao([group_route, slug_route])
+
+        await app(scope, AsyncMock(), AsyncMock())
+
+        assert group_route.call_args.args[0].path_parameters == parameters
+
+        scope["path"] = "/b/hello"
+        await app(scope, AsyncMock(), AsyncMock())
+
+        assert slug_route.call_args.args[0].path_parameters == {
+            "slug": "hello"
+        }
+
+    @mark.parametrize(
+        "path,called_route",
+        [
+            ("/d/1", 1),
+            ("/c/x/x", 2),
+            ("/c/x/y", 3),
+        ],
+    )
+    async def test_route_with_backreference(self, scope, path, called_route):
+        scope["path"] = path
+        post_route = AsyncMock()
+        post_route.path = "/c/{a}/{b}"
+        post_route.path_regex = Route.compile_path("/c/{a}/{b}")
+        repeated_route = AsyncMock()
+        repeated_route.path = "/c/{name}/{name}"
+        repeated_route.path_regex = re.compile(
+            "^/c/(?P<name>[^/]+)/(?P=name)$"
+        )
+        id_route = AsyncMock()
+        id_route.path = "/d/{id}"
+        id_route.path_regex = Route.compile_path("/d/{id}")
+        routes = [id_route, repeated_route, post_route]
+
+        app = Xiao(routes)
 
         await app(scope, AsyncMock(), AsyncMock())
 
-        app._routes[0].call_args.args[0].path_parameters == {"id": "1"}
+        for index, route in enumerate(routes, start=1):
+            if index == called_route:
+                route.assert_awaited_once()
+            else:
+                route.assert_not_awaited()
+        assert len(app._path_regexes) == 3
+        assert app._path_regexes[1] == (
+            repeated_route.path_regex,
+            repeated_route,
+        )
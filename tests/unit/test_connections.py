@@ -50,6 +50,15 @@ class TestConnection:
         assert connection._receive is receive
         assert connection._send is send
 
+    async def test_receive_request_not_implemented(self):
+        class BareConnection(Connection):
+            protocol = "test"
+
+        connection = BareConnection({"type": "test"}, AsyncMock(), AsyncMock())
+
+        with raises(NotImplementedError):
+            await connection.receive_request()
+
     def test_create_instance_with_different_protocol(self):
         with raises(
             ValueError,
@@ -79,6 +88,13 @@ class TestConnection:
             "content-length": "5",
         }
 
+    def test_headers_cached(self, headers):
+        scope = {"type": "test", "headers": headers}
+
+        connection = self.MockConnection(scope, AsyncMock(), AsyncMock())
+
+        assert connection.headers is connection.headers
+
     def test_url(self):
         scope = {
             "type": "test",
@@ -125,6 +141,9 @@ class TestHttpConnection:
         assert http_connection._receive is receive
         assert http_connection._send is send
 
+    def test_has_no_instance_dict(self, http_connection):
+        assert not hasattr(http_connection, "__dict__")
+
     @mark.parametrize(
         "method",
         [
@@ -161,6 +180,21 @@ class TestHttpConnection:
         assert received_request.data == {"body": b"", "more_body": False}
         receive.assert_awaited_once()
 
+    async def test_receive_message(self):
+        message = {"type": "http.request", "body": b"", "more_body": False}
+        receive = AsyncMock(return_value=message)
+
+        http_connection = HttpConnection(
+            {"type": "http"}, receive, AsyncMock()
+        )
+
+        assert await http_connection.receive_message() is message
+        assert message == {
+            "type": "http.request",
+            "body": b"",
+            "more_body": False,
+        }
+
     async def test_send_response(self):
         send = AsyncMock()
         response = PlainTextResponse()
@@ -513,6 +547,23 @@ class TestWebSocketConnection:
         assert received_request.type == "disconnect"
         assert received_request.data == {}
 
+    async def test_receive_message_with_disconnect_message_type(
+        self, websocket_connection
+    ):
+        websocket_connection.connection_state = "connected"
+        websocket_connection._receive.return_value = {
+            "type": "websocket.disconnect",
+            "code": 1000,
+        }
+
+        received_message = await websocket_connection.receive_message()
+
+        assert websocket_connection.connection_state == "disconnected"
+        assert received_message == {
+            "type": "websocket.disconnect",
+            "code": 1000,
+        }
+
     async def test_receive_request_with_disconnected_connection(
         self, websocket_connection
     ):
@@ -550,6 +601,45 @@ class TestWebSocketConnection:
             }
         )
 
+    async def test_send_response(self, websocket_connection):
+        await websocket_connection.send_response(
+            PlainTextResponse(status=403, body=b"Forbidden")
+        )
+
+        assert websocket_connection.protocol == "websocket.http"
+        websocket_connection._send.assert_has_awaits(
+            [
+                call(
+                    {
+                        "type": "websocket.http.response.start",
+                        "status": 403,
+                        "headers": [
+                            (b"content-length", b"9"),
+                            (b"content-type", b"text/plain; charset=utf-8"),
+                        ],
+                    }
+                ),
+                call(
+                    {
+                        "type": "websocket.http.response.body",
+                        "body": b"Forbidden",
+                        "more_body": False,
+                    }
+                ),
+            ]
+        )
+
+    async def test_send_body(self, websocket_connection):
+        await websocket_connection.send_body(b"Forbidden")
+
+        websocket_connection._send.assert_awaited_once_with(
+            {
+                "type": "websocket.http.response.body",
+                "body": b"Forbidden",
+                "more_body": False,
+            }
+        )
+
 
 class TestMakeConnection:
     @mark.parametrize(
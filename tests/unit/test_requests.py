@@ -22,3 +22,8 @@ class TestRequest:
         }
         assert request.protocol == "http"
         assert request.type == "request"
+
+    def test_has_no_instance_dict(self):
+        request = Request(data={}, protocol="http", type="request")
+
+        assert not hasattr(request, "__dict__")
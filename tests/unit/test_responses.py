@@ -1,10 +1,13 @@
-from pytest import fixture
+from collections import UserDict
+
+from pytest import fixture, raises
 
 from xiao_asgi.responses import (
     HtmlResponse,
     PlainTextResponse,
     Response,
     TextResponse,
+    encode_headers,
 )
 
 
@@ -37,6 +40,13 @@ class TestResponse:
         assert response.body == b""
         assert response.headers == {}
 
+    def test_create_without_headers_shares_empty_headers(self):
+        response = BasicResponse()
+
+        assert response.headers is BasicResponse().headers
+        with raises(TypeError):
+            response.headers["server"] = "xiao"
+
     def test_create_with_values(self, headers):
         response = BasicResponse(
             status=201, body="Hello, World!", headers=headers
@@ -46,6 +56,13 @@ class TestResponse:
         assert response.body == "Hello, World!"
         assert response.headers == headers
 
+    def test_media_type_encoded_on_subclass(self):
+        assert BasicResponse._media_type_bytes == b"text/basic"
+
+    def test_render_body_not_implemented(self):
+        with raises(NotImplementedError):
+            Response().render_body()
+
     def test_render_headers(self, headers):
         response = BasicResponse(headers=headers, body=b"Hello, World!")
 
@@ -59,6 +76,44 @@ class TestResponse:
             (b"content-type", b"text/basic"),
         ]
 
+    def test_render_headers_with_encoded_headers(self):
+        headers = [(b"cache-control", b"no-cache")]
+        response = BasicResponse(headers=headers, body=b"Hello, World!")
+
+        assert response.render_headers() == [
+            (b"cache-control", b"no-cache"),
+            (b"content-length", b"13"),
+            (b"content-type", b"text/basic"),
+        ]
+        assert headers == [(b"cache-control", b"no-cache")]
+
+    def test_render_headers_with_encoded_tuple_headers(self):
+        response = BasicResponse(headers=((b"x-id", b"1"),), body=b"Hello")
+
+        assert response.render_headers() == [
+            (b"x-id", b"1"),
+            (b"content-length", b"5"),
+            (b"content-type", b"text/basic"),
+        ]
+
+    def test_render_headers_with_mapping_headers(self):
+        headers = UserDict({"Cache-Control": "no-cache"})
+        response = BasicResponse(headers=headers, body=b"Hello")
+
+        assert response.render_headers() == [
+            (b"cache-control", b"no-cache"),
+            (b"content-length", b"5"),
+            (b"content-type", b"text/basic"),
+        ]
+
+    def test_render_headers_with_large_body(self):
+        response = BasicResponse(body=b"a" * 5000)
+
+        assert response.render_headers() == [
+            (b"content-length", b"5000"),
+            (b"content-type", b"text/basic"),
+        ]
+
     def test_render_response(self, headers):
         response = BasicResponse(
             status=201, headers=headers, body="Hello, World!"
@@ -90,10 +145,19 @@ class TestTextResponse:
         assert text_response.body == b""
         assert text_response.charset == "utf-8"
 
-    def test_create_with_values(self):
-        text_response = TextResponse(charset="ascii")
+    def test_create_with_values(self, headers):
+        text_response = TextResponse(
+            charset="ascii", status=201, headers=headers, body="Hello"
+        )
 
         assert text_response.charset == "ascii"
+        assert text_response.status == 201
+        assert text_response.headers == headers
+        assert text_response.body == "Hello"
+
+    def test_create_with_unknown_argument(self):
+        with raises(TypeError):
+            TextResponse(media_type="text/csv")
 
     def test_render_body_with_bytes(self):
         response = TextResponse(body=b"Hello, World!")
@@ -106,8 +170,9 @@ class TestTextResponse:
         assert response.render_body() == "Hello, World!".encode("utf-8")
 
     def test_render_headers(self, headers):
-        text_response = TextResponse(headers=headers, body=b"Hello, World!")
-        text_response.media_type = "text/plain"
+        text_response = PlainTextResponse(
+            headers=headers, body=b"Hello, World!"
+        )
         rendered_headers = text_response.render_headers()
 
         assert rendered_headers == [
@@ -120,6 +185,9 @@ class TestTextResponse:
             (b"content-type", b"text/plain; charset=utf-8"),
         ]
 
+    def test_has_no_instance_dict(self):
+        assert not hasattr(PlainTextResponse(), "__dict__")
+
 
 class TestPlainResponse:
     def test_create(self):
@@ -135,3 +203,13 @@ class TestHtmlResponse:
 
         assert isinstance(html_response, TextResponse)
         assert html_response.media_type == "text/html"
+
+
+class TestEncodeHeaders:
+    def test_encode_headers(self):
+        headers = {"Cache-Control": "no-cache", "X-Id": "1"}
+
+        assert encode_headers(headers) == [
+            (b"cache-control", b"no-cache"),
+            (b"x-id", b"1"),
+        ]
@@ -46,6 +46,11 @@ class TestRoute:
         assert compiled_path.fullmatch("/post/2021/12/04/test-post")
         assert compiled_path.fullmatch("/post/2021/12/04/") is None
 
+    def test_compile_path_is_cached(self):
+        assert Route.compile_path("/post/{id}") is Route.compile_path(
+            "/post/{id}"
+        )
+
     async def test_get_endpoint_with_valid_endpoint(self, route):
         get_endpoint = Mock()
         route.get = get_endpoint
@@ -160,6 +165,42 @@ class TestHttpRoute:
             ]
         )
 
+    async def test_send_method_not_allowed_messages_not_shared(
+        self, http_route, http_connection
+    ):
+        await http_route.send_method_not_allowed(http_connection)
+        start, body = (
+            awaited.args[0]
+            for awaited in http_connection._send.await_args_list
+        )
+        start["headers"].append((b"set-cookie", b"session=alice"))
+        body["body"] = b""
+        http_connection._send.reset_mock()
+
+        await http_route.send_method_not_allowed(http_connection)
+
+        http_connection._send.assert_has_awaits(
+            [
+                call(
+                    {
+                        "type": "http.response.start",
+                        "status": 405,
+                        "headers": [
+                            (b"content-length", b"18"),
+                            (b"content-type", b"text/plain; charset=utf-8"),
+                        ],
+                    }
+                ),
+                call(
+                    {
+                        "type": "http.response.body",
+                        "body": b"Method Not Allowed",
+                        "more_body": False,
+                    }
+                ),
+            ]
+        )
+
     async def test_send_method_not_allowed(self, http_route, http_connection):
         await http_route.send_method_not_allowed(http_connection)
 
@@ -221,9 +262,29 @@ class TestHttpRoute:
             ]
         )
 
-    async def test_call_with_endpoint_error(self, http_route, http_connection):
-        http_connection.scope["method"] = "get"
-        http_route.get = AsyncMock(side_effect=Exception)
+    async def test_call_with_non_endpoint_method(
+        self, http_route, http_connection
+    ):
+        http_connection.scope["method"] = "send_not_implemented"
+
+        with raises(AttributeError):
+            await http_route(http_connection)
+
+        http_connection._send.assert_awaited_with(
+            {
+                "type": "http.response.body",
+                "body": b"Not Implemented",
+                "more_body": False,
+            }
+        )
+
+    async def test_call_with_endpoint_error(self, http_connection):
+        class ErrorRoute(HttpRoute):
+            get = AsyncMock(side_effect=Exception)
+
+        http_route = ErrorRoute("/test")
+        http_connection.scope["method"] = "GET"
+        http_connection._receive.return_value = {"type": "http.request"}
 
         with raises(Exception):
             await http_route(http_connection)
@@ -250,12 +311,13 @@ class TestHttpRoute:
             ]
         )
 
-    async def test_call_with_no_error(
-        self, http_route, http_connection, http_request
-    ):
-        http_connection.receive_request = AsyncMock(return_value=http_request)
-        http_connection.scope["method"] = "get"
-        http_route.get = AsyncMock()
+    async def test_call_with_no_error(self, http_connection, http_request):
+        class EndpointRoute(HttpRoute):
+            get = AsyncMock()
+
+        http_route = EndpointRoute("/test")
+        http_connection._receive.return_value = {"type": "http.request"}
+        http_connection.scope["method"] = "GET"
 
         await http_route(http_connection)
 
@@ -296,9 +358,22 @@ class TestWebSocketRoute:
     async def test_call_with_missing_endpoint(
         self, websocket_route, websocket_connection, websocket_request
     ):
-        websocket_request.type = "invalid"
         websocket_connection.receive_request = AsyncMock(
-            return_value=websocket_request
+            return_value=websocket_request._replace(type="invalid")
+        )
+
+        with raises(AttributeError):
+            await websocket_route(websocket_connection)
+
+        websocket_connection._send.assert_awaited_once_with(
+            {"type": "websocket.close", "code": 1011}
+        )
+
+    async def test_call_with_non_endpoint_request_type(
+        self, websocket_route, websocket_connection, websocket_request
+    ):
+        websocket_connection.receive_request = AsyncMock(
+            return_value=websocket_request._replace(type="send_internal_error")
         )
 
         with raises(AttributeError):
@@ -311,7 +386,11 @@ class TestWebSocketRoute:
     async def test_call_with_endpoint_error(
         self, websocket_route, websocket_connection, websocket_request
     ):
-        websocket_connection.receive = AsyncMock(
+        class ErrorRoute(WebSocketRoute):
+            receive = AsyncMock(side_effect=Exception)
+
+        websocket_route = ErrorRoute("/test")
+        websocket_connection.receive_request = AsyncMock(
             return_value=websocket_request
         )
 
@@ -325,10 +404,13 @@ class TestWebSocketRoute:
     async def test_call_with_no_error(
         self, websocket_route, websocket_connection, websocket_request
     ):
+        class EndpointRoute(WebSocketRoute):
+            receive = AsyncMock()
+
+        websocket_route = EndpointRoute("/test")
         websocket_connection.receive_request = AsyncMock(
             return_value=websocket_request
         )
-        websocket_route.receive = AsyncMock()
 
         await websocket_route(websocket_connection)
 
@@ -0,0 +1,28 @@
+import asyncio
+import sys
+from unittest.mock import Mock, patch
+
+from pytest import raises
+
+from xiao_asgi.runtime import install_uvloop
+
+
+class TestInstallUvloop:
+    def test_install(self):
+        uvloop = Mock()
+
+        with patch.dict(sys.modules, {"uvloop": uvloop}), patch.object(
+            asyncio, "set_event_loop_policy"
+        ) as set_event_loop_policy:
+            install_uvloop()
+
+        set_event_loop_policy.assert_called_once_with(
+            uvloop.EventLoopPolicy.return_value
+        )
+
+    def test_install_without_uvloop(self):
+        with patch.dict(sys.modules, {"uvloop": None}), raises(
+            ImportError,
+            match="uvloop must be installed to use it for the event loop.",
+        ):
+            install_uvloop()
@@ -12,5 +12,6 @@ Modules:
         sending as a response.
     routing: representations of a route and holds the endpoints for processing
         a request.
+    runtime: helpers for the environment an application runs in.
 """
 __version__ = "0.1.0"
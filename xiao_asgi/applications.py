@@ -3,13 +3,29 @@
 The ``Xiao`` class provides a base from which ASGI application can be built
 for consumption by an ASGI webserver.
 """
+import re
+from collections import OrderedDict
 from collections.abc import Coroutine
 from logging import getLogger
+from typing import Optional, Union
 
 from xiao_asgi.connections import make_connection
 from xiao_asgi.responses import PlainTextResponse
 from xiao_asgi.routing import Route
 
+_NOT_FOUND_BODY = b"Not Found"
+"""bytes: the body of a 404 HTTP response."""
+
+_NOT_FOUND_HEADERS = tuple(
+    PlainTextResponse(status=404, body=_NOT_FOUND_BODY).render_headers()
+)
+"""tuple[tuple[bytes, bytes], ...]: the headers of a 404 HTTP response,
+rendered once and copied in to each response that is sent."""
+
+_UNCOMBINABLE_PATTERN = re.compile(r"\(\?P=|\(\?\(|\\[1-9]")
+"""re.Pattern: finds backreferences and conditionals, which refer to groups
+by a name or number that changes when a regex is combined with others."""
+
 
 class Xiao:
     """A base ASGI application.
@@ -20,16 +36,31 @@ class Xiao:
     Attributes:
         logger (Logger): a ``Logger`` instance for logging application
             exceptions.
-        routes (list[Route]): a ``Router`` instance with the available
-            routes.
+        _routes (tuple[Route, ...]): the available routes.
+        _static_routes (dict[str, Route]): routes whose path regex only
+            matches their path, keyed by their path.
+        _path_regexes (list[tuple[re.Pattern, Union[Route, dict]]]): the
+            regexes for matching dynamic routes, in route order. The regexes
+            of consecutive routes are combined in to a single regex, paired
+            with a dict that maps the index of each route's group to the
+            route and the names and indexes of its path parameters. A route
+            whose regex cannot be combined is paired with its own regex.
+        _matched_paths (OrderedDict[str, tuple[Route, dict[str, str]]]):
+            recently matched dynamic paths and the route and path parameters
+            they matched, oldest first, holding at most
+            ``matched_paths_size`` paths.
+        matched_paths_size (int): the maximum number of matched dynamic paths
+            to remember. Defaults to 1024.
     """
 
-    def __init__(self, routes: list[Route] = []) -> None:
+    matched_paths_size: int = 1024
+
+    def __init__(self, routes: Optional[list[Route]] = None) -> None:
         """Establish the application's available routes.
 
         Args:
-            routes (list[Route], optional): the available routes. Defaults to
-                an empty list.
+            routes (Optional[list[Route]], optional): the available routes.
+                Defaults to None, for no routes.
 
         Example:
             Creating an application::
@@ -40,7 +71,86 @@ class Xiao:
                 >>> ])
         """
         self.logger = getLogger(name="xiao-asgi")
-        self._routes = routes
+        self._routes = tuple(routes or ())
+        self._static_routes: dict[str, Route] = {}
+        dynamic_routes: list[Route] = []
+
+        for route in self._routes:
+            # A route is static only if its path regex matches its path and
+            # nothing else, which is not the case for a path with parameters
+            # or a customised ``compile_path``. A static route stays with the
+            # dynamic routes if an earlier dynamic route would match its path
+            # first.
+            if (
+                route.path_regex.pattern != f"^{re.escape(route.path)}$"
+                or route.path_regex.flags != re.UNICODE
+                or any(
+                    dynamic_route.path_regex.match(route.path)
+                    for dynamic_route in dynamic_routes
+                )
+            ):
+                dynamic_routes.append(route)
+            else:
+                self._static_routes.setdefault(route.path, route)
+
+        self._path_regexes: list[
+            tuple[
+                re.Pattern,
+                Union[
+                    Route, dict[int, tuple[Route, tuple[tuple[str, int], ...]]]
+                ],
+            ]
+        ] = []
+        patterns = []
+        combined_routes = {}
+        group = 1
+
+        # Each route's regex becomes one group of an alternation, with its
+        # parameters as unnamed groups so that names can repeat between
+        # routes. ``Match.lastindex`` is then the index of the route's group,
+        # and each parameter is found by its index relative to that group.
+        # Regexes with flags, backreferences or conditionals depend on being
+        # compiled alone, so they are matched separately, in route order.
+        for route in dynamic_routes:
+            path_regex = route.path_regex
+
+            if path_regex.flags != re.UNICODE or _UNCOMBINABLE_PATTERN.search(
+                path_regex.pattern
+            ):
+                if patterns:
+                    self._path_regexes.append(
+                        (re.compile("|".join(patterns)), combined_routes)
+                    )
+                    patterns = []
+                    combined_routes = {}
+                    group = 1
+
+                self._path_regexes.append((path_regex, route))
+                continue
+
+            pattern = path_regex.pattern
+
+            for parameter in path_regex.groupindex:
+                pattern = pattern.replace(f"(?P<{parameter}>", "(")
+
+            patterns.append(f"({pattern})")
+            combined_routes[group] = (
+                route,
+                tuple(
+                    (parameter, group + index - 1)
+                    for parameter, index in path_regex.groupindex.items()
+                ),
+            )
+            group += path_regex.groups + 1
+
+        if patterns:
+            self._path_regexes.append(
+                (re.compile("|".join(patterns)), combined_routes)
+            )
+
+        self._matched_paths: OrderedDict[
+            str, tuple[Route, dict[str, str]]
+        ] = OrderedDict()
 
     async def __call__(
         self, scope: dict, receive: Coroutine, send: Coroutine
@@ -61,18 +171,61 @@ class Xiao:
                 $ hypercorn main:app
         """
         connection = make_connection(scope, receive, send)
+        path = scope["path"]
+        route = self._static_routes.get(path)
+
+        if route is not None:
+            connection.path_parameters = {}
+        elif matched_path := self._matched_paths.get(path):
+            route, path_parameters = matched_path
+            connection.path_parameters = path_parameters.copy()
+        elif matched_route := self._match_dynamic_route(path):
+            route, path_parameters = matched_route
+            connection.path_parameters = path_parameters.copy()
+
+            # The oldest path is forgotten once the limit is reached.
+            if len(self._matched_paths) >= self.matched_paths_size:
+                self._matched_paths.popitem(last=False)
+
+            self._matched_paths[path] = (route, path_parameters)
+        else:
+            # New messages are sent for each response, as middleware may
+            # change a message after it is sent.
+            await connection.send_start(404, list(_NOT_FOUND_HEADERS))
+            await connection.send_body(_NOT_FOUND_BODY)
+            return
+
+        try:
+            await route(connection)
+        except Exception as exception:
+            self.logger.exception("EXCEPTION", exc_info=exception)
+
+    def _match_dynamic_route(
+        self, path: str
+    ) -> Optional[tuple[Route, dict[str, str]]]:
+        """Return the first dynamic route that matches a path.
 
-        for route in self._routes:
-            if match := route.path_regex.match(scope["path"]):
-                connection.path_parameters = match.groupdict()
-
-                try:
-                    await route(connection)
-                except Exception as exception:
-                    self.logger.exception("EXCEPTION", exc_info=exception)
-                finally:
-                    return
-
-        await connection.send_response(
-            PlainTextResponse(status=404, body=b"Not Found")
-        )
+        Args:
+            path (str): the path to match.
+
+        Returns:
+            Optional[tuple[Route, dict[str, str]]]: the matching route and
+                its path parameters, or None if no route matches.
+        """
+        for path_regex, routes in self._path_regexes:
+            match = path_regex.match(path)
+
+            if match is None:
+                continue
+
+            if not isinstance(routes, dict):
+                return routes, match.groupdict()
+
+            route, parameters = routes[match.lastindex]
+            groups = match.groups()
+
+            return route, {
+                parameter: groups[index] for parameter, index in parameters
+            }
+
+        return None
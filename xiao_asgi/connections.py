@@ -8,7 +8,7 @@ Classes:
     ProtocolMismatch: protocols between two objects do not match.
     InvalidConnectionState: connection state of a client/application is not
         appropriate for the request/response.
-    Connection: abstract base class from which connection classes can be built
+    Connection: base class from which connection classes can be built
         for a protocol.
     HttpConnection: for handling HTTP connections.
     WebSocketConnection: for handling WebSocket connections.
@@ -20,12 +20,27 @@ Functions:
 Variables:
     protocols: list of known protocols and their associated connection class.
 """
-from abc import ABC, abstractmethod
-from collections.abc import Coroutine, Iterable
-from typing import IO, AnyStr, Optional
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from xiao_asgi.requests import Request
-from xiao_asgi.responses import Response
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable
+    from typing import IO, AnyStr, Optional
+
+    from xiao_asgi.responses import Response
+
+_decode = bytes.decode
+"""Callable[[bytes, str], str]: ``bytes.decode``, bound once for decoding."""
+
+_WEBSOCKET_CONNECTION_STATES = {
+    "websocket.connect": "connected",
+    "websocket.disconnect": "disconnected",
+}
+"""dict[str, str]: maps WebSocket message types to the connection state they
+set."""
 
 
 class ProtocolUnknown(Exception):
@@ -66,7 +81,7 @@ class InvalidConnectionState(Exception):
     """
 
 
-class Connection(ABC):
+class Connection:
     """A base connection class for handling messages to and from a connection.
 
     Can be extended for a specific protocol.
@@ -75,10 +90,23 @@ class Connection(ABC):
         path_parameters (Optional[dict[str, str]]): parameters in the url path.
         protocol (str): name of the connection protocol.
         scope (dict[str, Any]): the connection information.
+        _headers (Optional[dict[str, str]]): the decoded headers, once
+            ``headers`` has been accessed.
         _receive (Coroutine): coroutine for receiving requests.
         _send (Coroutine): coroutine for sending responses.
+        _url (Optional[dict[str, str]]): the URL information, once ``url`` has
+            been accessed.
     """
 
+    __slots__ = (
+        "path_parameters",
+        "scope",
+        "_headers",
+        "_receive",
+        "_send",
+        "_url",
+    )
+
     protocol: str
 
     def __init__(
@@ -106,43 +134,71 @@ class Connection(ABC):
         self.scope = scope
         self._receive = receive
         self._send = send
+        self._headers: Optional[dict[str, str]] = None
+        self._url: Optional[dict[str, str]] = None
 
     @property
     def headers(self) -> dict[str, str]:
         """Return the headers provided in the connection.
 
+        The headers are decoded on first access and cached.
+
         Returns:
             dict[str, str]: the connection's headers.
         """
-        return {
-            key.decode("latin-1"): value.decode("latin-1")
-            for key, value in self.scope.get("headers", [])
-        }
+        if self._headers is None:
+            self._headers = {
+                _decode(key, "latin-1"): _decode(value, "latin-1")
+                for key, value in self.scope.get("headers", [])
+            }
+
+        return self._headers
 
     @property
     def url(self) -> dict[str, str]:
         """Return the URL information provided in the connection.
 
-        The URL is split in to its separate components.
+        The URL is split in to its separate components on first access and
+        cached.
 
         Returns:
             dict[str, str]: the URL information.
         """
-        return {
-            "scheme": self.scope.get("scheme"),
-            "server": self.scope.get("server"),
-            "root_path": self.scope.get("root_path"),
-            "path": self.scope.get("path"),
-            "query_string": self.scope.get("query_string"),
-        }
+        if self._url is None:
+            get = self.scope.get
+            self._url = {
+                "scheme": get("scheme"),
+                "server": get("server"),
+                "root_path": get("root_path"),
+                "path": get("path"),
+                "query_string": get("query_string"),
+            }
+
+        return self._url
+
+    async def receive_message(self) -> dict:
+        """Receive a message from the client without parsing it.
+
+        Can be used instead of ``receive_request`` when only the ASGI message
+        is needed, avoiding the creation of a ``Request``.
+
+        Returns:
+            dict: the received ASGI message.
+        """
+        return await self._receive()
 
-    @abstractmethod
     async def receive_request(self) -> Request:
         """Receive a request from the client.
 
+        Must be overridden by a connection class for a protocol.
+
+        Raises:
+            NotImplementedError: if not overridden.
+
         Returns:
             Request: the received request.
         """
+        raise NotImplementedError()
 
 
 class HttpConnection(Connection):
@@ -153,11 +209,23 @@ class HttpConnection(Connection):
 
     Attributes:
         protocol (str): name of the connection protocol, defaults to http.
-        connection_status (bool): the current status of the connection
-            response.
+        _TYPE_BODY (str): the type of a body response message.
+        _TYPE_PUSH (str): the type of a push response message.
+        _TYPE_START (str): the type of a start response message.
+        _TYPE_ZERO_COPY_SEND (str): the type of a zero copy send response
+            message.
+        _BODY_MESSAGE (dict[str, Any]): a final, empty body response message
+            that is copied when sending a body response.
     """
 
+    __slots__ = ()
+
     protocol: str = "http"
+    _TYPE_BODY: str = "http.response.body"
+    _TYPE_PUSH: str = "http.response.push"
+    _TYPE_START: str = "http.response.start"
+    _TYPE_ZERO_COPY_SEND: str = "http.response.zerocopysend"
+    _BODY_MESSAGE: dict = {"type": _TYPE_BODY, "body": b"", "more_body": False}
 
     @property
     def method(self) -> str:
@@ -175,11 +243,9 @@ class HttpConnection(Connection):
             Request: the received request.
         """
         request = await self._receive()
-        protocol, type = request["type"].split(".")
-
-        del request["type"]
+        protocol, _, type = request.pop("type").partition(".")
 
-        return Request(protocol=protocol, type=type, data=request)
+        return Request(request, protocol, type)
 
     async def send_body(
         self, data: bytes = b"", more_body: bool = False
@@ -196,13 +262,13 @@ class HttpConnection(Connection):
                 will be sent after this message. A value of ``False`` will
                 result in the connection being closed. Defaults to False.
         """
-        await self._send(
-            {
-                "type": f"{self.protocol}.response.body",
-                "body": data,
-                "more_body": more_body,
-            }
-        )
+        message = self._BODY_MESSAGE.copy()
+        message["body"] = data
+
+        if more_body:
+            message["more_body"] = True
+
+        await self._send(message)
 
     async def send_push(
         self, path: str, headers: Iterable[Iterable[bytes, bytes]] = []
@@ -216,7 +282,7 @@ class HttpConnection(Connection):
         """
         await self._send(
             {
-                "type": f"{self.protocol}.response.push",
+                "type": self._TYPE_PUSH,
                 "path": path,
                 "headers": headers,
             }
@@ -225,16 +291,28 @@ class HttpConnection(Connection):
     async def send_response(self, response: type[Response]) -> None:
         """Send a response to the client.
 
+        The start and body messages are sent directly rather than through
+        ``send_start`` and ``send_body``.
+
         Args:
             response (type[Response]): the response to send.
         """
         rendered_response = response.render_response()
+        send = self._send
 
-        await self.send_start(
-            rendered_response["status"], rendered_response["headers"]
+        await send(
+            {
+                "type": self._TYPE_START,
+                "status": rendered_response["status"],
+                "headers": rendered_response["headers"],
+            }
         )
-        await self.send_body(
-            rendered_response["body"], rendered_response["more_body"]
+        await send(
+            {
+                "type": self._TYPE_BODY,
+                "body": rendered_response["body"],
+                "more_body": rendered_response["more_body"],
+            }
         )
 
     async def send_start(
@@ -252,7 +330,7 @@ class HttpConnection(Connection):
         """
         await self._send(
             {
-                "type": f"{self.protocol}.response.start",
+                "type": self._TYPE_START,
                 "status": status_code,
                 "headers": headers,
             }
@@ -278,7 +356,7 @@ class HttpConnection(Connection):
                 result in the connection being closed. Defaults to False.
         """
         response = {
-            "type": f"{self.protocol}.response.zerocopysend",
+            "type": self._TYPE_ZERO_COPY_SEND,
             "file": file,
             "more_body": more_body,
         }
@@ -298,13 +376,29 @@ class WebSocketConnection(HttpConnection):
     This connection class is capable of receiving requests and sending
     responses that have the type websocket.
 
+    HTTP responses sent on a WebSocket connection use the types of the
+    WebSocket Denial Response extension.
+
     Attributes:
         protocol (str): name of the connection protocol, defaults to websocket.
         connection_state (str): the current state of the connection. Defaults
             to connecting.
+        _TYPE_ACCEPT (str): the type of an accept message.
+        _TYPE_CLOSE (str): the type of a close message.
+        _TYPE_SEND (str): the type of a send message.
     """
 
+    # No __slots__ are declared as ``send_start`` replaces ``protocol`` on the
+    # instance, which needs an instance ``__dict__``.
     protocol: str = "websocket"
+    _TYPE_ACCEPT: str = "websocket.accept"
+    _TYPE_BODY: str = "websocket.http.response.body"
+    _TYPE_CLOSE: str = "websocket.close"
+    _TYPE_PUSH: str = "websocket.http.response.push"
+    _TYPE_SEND: str = "websocket.send"
+    _TYPE_START: str = "websocket.http.response.start"
+    _TYPE_ZERO_COPY_SEND: str = "websocket.http.response.zerocopysend"
+    _BODY_MESSAGE: dict = {"type": _TYPE_BODY, "body": b"", "more_body": False}
 
     def __init__(self, *args):
         """Set the connection state for the application and client."""
@@ -338,7 +432,7 @@ class WebSocketConnection(HttpConnection):
         """
         await self._send(
             {
-                "type": f"{self.protocol}.accept",
+                "type": self._TYPE_ACCEPT,
                 "subprotocol": subprotocol,
                 "headers": headers,
             }
@@ -353,9 +447,26 @@ class WebSocketConnection(HttpConnection):
         Args:
             code (Optional[int], optional): the close code. Defaults to 1000.
         """
-        await self._send({"type": f"{self.protocol}.close", "code": code})
+        await self._send({"type": self._TYPE_CLOSE, "code": code})
         self.connection_state = "closed"
 
+    async def receive_message(self) -> dict:
+        """Receive a message from the client without parsing it.
+
+        The connection state is updated from the type of the message.
+
+        Raises:
+            InvalidConnectionState: ``self.connection_state`` is disconnected.
+
+        Returns:
+            dict: the received ASGI message.
+        """
+        self._check_not_disconnected()
+        message = await self._receive()
+        self._update_connection_state(message)
+
+        return message
+
     async def receive_request(self) -> Request:
         """Receive a request from the client.
 
@@ -365,22 +476,12 @@ class WebSocketConnection(HttpConnection):
         Returns:
             Request: the received request.
         """
-        if self.connection_state == "disconnected":
-            raise InvalidConnectionState(
-                "Cannot receive a request from a disconnected connection."
-            )
-
+        self._check_not_disconnected()
         request = await self._receive()
-        protocol, type = request["type"].split(".")
+        self._update_connection_state(request)
+        protocol, _, type = request.pop("type").partition(".")
 
-        if type == "connect":
-            self.connection_state = "connected"
-        elif type == "disconnect":
-            self.connection_state = "disconnected"
-
-        del request["type"]
-
-        return Request(protocol=protocol, type=type, data=request)
+        return Request(request, protocol, type)
 
     async def send_bytes(self, data: bytes) -> None:
         """Send a message containing bytes data to the client.
@@ -390,11 +491,25 @@ class WebSocketConnection(HttpConnection):
         """
         await self._send(
             {
-                "type": f"{self.protocol}.send",
+                "type": self._TYPE_SEND,
                 "bytes": data,
             }
         )
 
+    async def send_response(self, response: type[Response]) -> None:
+        """Send a response to the client.
+
+        Can be used to send a denial response using the WebSocket Denial
+        Response extension. The protocol of the connection will be changed to
+        websocket.http.
+
+        Args:
+            response (type[Response]): the response to send.
+        """
+        self.protocol = "websocket.http"
+
+        await super().send_response(response)
+
     async def send_start(self, *args, **kwargs) -> None:
         """Send a HTTP start response.
 
@@ -414,11 +529,32 @@ class WebSocketConnection(HttpConnection):
         """
         await self._send(
             {
-                "type": f"{self.protocol}.send",
+                "type": self._TYPE_SEND,
                 "text": data,
             }
         )
 
+    def _check_not_disconnected(self) -> None:
+        """Check that the client has not disconnected.
+
+        Raises:
+            InvalidConnectionState: ``self.connection_state`` is disconnected.
+        """
+        if self.connection_state == "disconnected":
+            raise InvalidConnectionState(
+                "Cannot receive a request from a disconnected connection."
+            )
+
+    def _update_connection_state(self, message: dict) -> None:
+        """Update the connection state from the type of a received message.
+
+        Args:
+            message (dict): the message received from the client.
+        """
+        self.connection_state = _WEBSOCKET_CONNECTION_STATES.get(
+            message["type"], self.connection_state
+        )
+
 
 protocols = {"http": HttpConnection, "websocket": WebSocketConnection}
 """dict[str, type[Connection]]: maps protocol names to connection classes."""
@@ -435,12 +571,14 @@ def make_connection(scope, receive, send) -> type[Connection]:
             response to the client.
 
     Raises:
-        Exception: if the scope protocol is not available in protocols.
+        ProtocolUnknown: if the scope protocol is not available in protocols.
 
     Returns:
         type[Connection]: a ``Connection`` instance for the protocol.
     """
-    try:
-        return protocols[scope["type"]](scope, receive, send)
-    except KeyError:
+    connection_class = protocols.get(scope["type"])
+
+    if connection_class is None:
         raise ProtocolUnknown()
+
+    return connection_class(scope, receive, send)
@@ -2,13 +2,11 @@
 
 The ``Request`` class can be used to hold a request's information.
 """
-from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 
 
-@dataclass
-class Request:
-    """A dataclass representation of a request.
+class Request(NamedTuple):
+    """A named tuple representation of a request.
 
     Holds the information of a request in an object for easy access.
 
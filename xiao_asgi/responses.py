@@ -4,32 +4,87 @@ A set of classes for creating response classes that can render for sending to
 the connection.
 
 Classes:
-    Response: abstract base class for creating HTTP responses.
+    Response: base class for creating HTTP responses.
     TextResponse: base class for text media responses.
     PlainTextResponse: plain text media type responses.
     HtmlResponse: HTML media type responses.
+
+Functions:
+    encode_headers: encode headers once for use by many responses.
 """
-from abc import ABC, abstractmethod
-from typing import Any, Union
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any, Optional, Union
+
+_EMPTY_HEADERS = MappingProxyType({})
+"""Mapping[str, Any]: the read-only headers shared by responses that are
+created without headers."""
+
+_CONTENT_LENGTHS = tuple(
+    str(length).encode("latin-1") for length in range(4097)
+)
+"""tuple[bytes, ...]: the encoded content-length header values for bodies of
+up to 4096 bytes, indexed by length."""
+
+
+def encode_headers(headers: Mapping[str, str]) -> list[tuple[bytes, bytes]]:
+    """Return headers encoded for a response.
 
+    The header names are lowercased and the names and values are encoded
+    using latin-1. Headers that are sent with many responses can be encoded
+    once and passed to each response, so they are not encoded every time a
+    response is rendered.
 
-class Response(ABC):
+    Args:
+        headers (Mapping[str, str]): the headers to encode.
+
+    Returns:
+        list[tuple[bytes, bytes]]: the encoded headers.
+
+    Example:
+        Encoding headers once for many responses::
+
+            >>> headers = encode_headers({"Cache-Control": "no-cache"})
+            >>> response = PlainTextResponse(headers=headers, body="Hello")
+    """
+    return [
+        (header.lower().encode("latin-1"), value.encode("latin-1"))
+        for header, value in headers.items()
+    ]
+
+
+class Response:
     """Base class for responses.
 
     Attributes:
         body (Union[bytes, Generator[bytes, None, None]]): the body content of
             the response.
         media_type (str): the media type of the response.
-        headers (list[bytes, bytes]): the headers of the response.
+        headers (Union[Mapping[str, Any], Iterable[tuple[bytes, bytes]]]):
+            the headers of the response, either as strings or already
+            encoded.
         status (int): a HTTP status code.
+        _media_type_bytes (bytes): ``media_type`` encoded using latin-1, set
+            when a response class defining ``media_type`` is created.
     """
 
+    __slots__ = ("status", "headers", "body")
+
     media_type: str
+    _media_type_bytes: bytes
 
     def __init__(
         self,
         status: int = 200,
-        headers: dict[str, Any] = {},
+        headers: Optional[
+            Union[Mapping[str, Any], Iterable[tuple[bytes, bytes]]]
+        ] = None,
         body: Union[str, bytes] = b"",
     ) -> None:
         """Establish the response information.
@@ -37,22 +92,40 @@ class Response(ABC):
         Args:
             status (int, optional): a HTTP status code. Defaults to
                 200.
-            headers (dict[str, Any], optional): the headers of the response.
-                Defaults to {}.
+            headers (Optional[Union[Mapping[str, Any],
+                Iterable[tuple[bytes, bytes]]]], optional): the headers of the
+                response, either as strings or already encoded using
+                ``encode_headers``. Defaults to None, for no headers.
             body (Union[str, bytes], optional): the body content of the
                 response. Defaults to b"".
         """
         self.status = status
-        self.headers = headers
+        self.headers = _EMPTY_HEADERS if headers is None else headers
         self.body = body
 
-    @abstractmethod
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Encode the media type of a new response class.
+
+        Args:
+            **kwargs: passed on to ``object.__init_subclass__``.
+        """
+        super().__init_subclass__(**kwargs)
+
+        if "media_type" in cls.__dict__:
+            cls._media_type_bytes = cls.media_type.encode("latin-1")
+
     def render_body(self) -> bytes:
         """Return the response body as ``bytes``.
 
+        Must be overridden by a response class for a media type.
+
+        Raises:
+            NotImplementedError: if not overridden.
+
         Returns:
             bytes: the response body.
         """
+        raise NotImplementedError()
 
     def render_headers(self) -> list[tuple[bytes, bytes]]:
         """Return the response headers as ``bytes``.
@@ -60,19 +133,8 @@ class Response(ABC):
         Returns:
             list[tuple[bytes, bytes]]: the response headers.
         """
-        rendered_headers = [
-            (header.lower().encode("latin-1"), value.encode("latin-1"))
-            for header, value in self.headers.items()
-        ]
-
-        content_length = str(len(self.body))
-        rendered_headers.append(
-            (b"content-length", content_length.encode("latin-1"))
-        )
-
-        rendered_headers.append(
-            (b"content-type", self.media_type.encode("latin-1"))
-        )
+        rendered_headers = self._render_headers()
+        rendered_headers.append((b"content-type", self._media_type_bytes))
 
         return rendered_headers
 
@@ -89,6 +151,36 @@ class Response(ABC):
             "more_body": False,
         }
 
+    def _render_headers(self) -> list[tuple[bytes, bytes]]:
+        """Return the response headers, except content-type, as ``bytes``.
+
+        Returns:
+            list[tuple[bytes, bytes]]: the response headers and the
+                content-length header.
+        """
+        headers = self.headers
+
+        # The concrete types are checked first, as checking against the
+        # Mapping ABC is several times slower.
+        if isinstance(headers, (dict, MappingProxyType)) or isinstance(
+            headers, Mapping
+        ):
+            rendered_headers = encode_headers(headers)
+        else:
+            rendered_headers = list(headers)
+
+        content_length = len(self.body)
+        rendered_headers.append(
+            (
+                b"content-length",
+                _CONTENT_LENGTHS[content_length]
+                if content_length < 4097
+                else str(content_length).encode("latin-1"),
+            )
+        )
+
+        return rendered_headers
+
 
 class TextResponse(Response):
     """A text response.
@@ -100,15 +192,37 @@ class TextResponse(Response):
         charset (str): the charset of the response's body. Defaults to utf-8.
     """
 
-    def __init__(self, charset: str = "utf-8", **kwargs) -> None:
-        """Establish the charset of the response.
+    __slots__ = ("charset",)
+
+    def __init__(
+        self,
+        charset: str = "utf-8",
+        status: int = 200,
+        headers: Optional[
+            Union[Mapping[str, Any], Iterable[tuple[bytes, bytes]]]
+        ] = None,
+        body: Union[str, bytes] = b"",
+    ) -> None:
+        """Establish the response information and its charset.
+
+        The attributes are set directly rather than through
+        ``Response.__init__``.
 
         Args:
             charset (str, optional): the charset of the response body.
                 Defaults to "utf-8".
+            status (int, optional): a HTTP status code. Defaults to
+                200.
+            headers (Optional[Union[Mapping[str, Any],
+                Iterable[tuple[bytes, bytes]]]], optional): the headers of the
+                response, either as strings or already encoded using
+                ``encode_headers``. Defaults to None, for no headers.
+            body (Union[str, bytes], optional): the body content of the
+                response. Defaults to b"".
         """
-        super().__init__(**kwargs)
-
+        self.status = status
+        self.headers = _EMPTY_HEADERS if headers is None else headers
+        self.body = body
         self.charset = charset
 
     def render_body(self) -> bytes:
@@ -126,22 +240,21 @@ class TextResponse(Response):
     def render_headers(self) -> list[tuple[bytes, bytes]]:
         """Return the response headers as ``bytes``.
 
-        The headers are encoded using latin-1. The content-type header is
-        changed to include the charset statement using the value in
-        ``self.charset``.
+        The headers are encoded using latin-1. The content-type header
+        includes the charset statement using the value in ``self.charset``.
 
         Returns:
             list[tuple[bytes, bytes]]: rendered headers.
         """
-        rendered_headers = super().render_headers()
-
-        for key, header in enumerate(rendered_headers):
-            if header[0] == b"content-type":
-                rendered_headers[key] = (
-                    b"content-type",
-                    header[1] + b"; charset=" + self.charset.encode("latin-1"),
-                )
-                break
+        rendered_headers = self._render_headers()
+        rendered_headers.append(
+            (
+                b"content-type",
+                self._media_type_bytes
+                + b"; charset="
+                + self.charset.encode("latin-1"),
+            )
+        )
 
         return rendered_headers
 
@@ -159,6 +272,8 @@ class PlainTextResponse(TextResponse):
             >>> response = PlainTextResponse(body="Hello, World!")
     """
 
+    __slots__ = ()
+
     media_type: str = "text/plain"
 
 
@@ -175,4 +290,6 @@ class HtmlResponse(TextResponse):
             >>> response = HtmlResponse(body="<html>...</html>")
     """
 
+    __slots__ = ()
+
     media_type: str = "text/html"
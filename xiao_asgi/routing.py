@@ -4,13 +4,13 @@ The available classes in this module can be used to construct routes for a
 particular protocol and their endpoints.
 
 Classes:
-    Route: abstract base class for building route classes for a protocol.
+    Route: base class for building route classes for a protocol.
     HttpRoute: a HTTP route and endpoints.
     WebSocketRoute: a WebSocket route.
 """
 import re
-from abc import ABC
 from collections.abc import Callable, Coroutine
+from functools import lru_cache
 
 from xiao_asgi.connections import (
     Connection,
@@ -24,7 +24,32 @@ from xiao_asgi.responses import PlainTextResponse
 route_regex = re.compile("{([a-zA-Z_][a-zA-Z0-9_]*)?}")
 
 
-class Route(ABC):
+def _render_plain_text(
+    status: int, body: bytes
+) -> tuple[int, tuple[tuple[bytes, bytes], ...], bytes]:
+    """Return the rendered parts of a plain text HTTP response.
+
+    The parts are immutable, so they can be shared by every response that is
+    sent with them.
+
+    Args:
+        status (int): a HTTP status code.
+        body (bytes): the body content of the response.
+
+    Returns:
+        tuple[int, tuple[tuple[bytes, bytes], ...], bytes]: the status,
+            headers and body of the response.
+    """
+    response = PlainTextResponse(status=status, body=body)
+
+    return (
+        response.status,
+        tuple(response.render_headers()),
+        response.render_body(),
+    )
+
+
+class Route:
     """A base class for routes.
 
     Can be extended to create routes that involve a particular protocol.
@@ -52,9 +77,13 @@ class Route(ABC):
         self.path_regex: re.Pattern = self.compile_path(path)
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def compile_path(path: str) -> re.Pattern:
         """Create a regex object for a path.
 
+        The regex object is cached, so routes that share a path also share
+        the same regex object.
+
         Args:
             path (str): the path to create a regex object from.
 
@@ -127,9 +156,23 @@ class Route(ABC):
 class HttpRoute(Route):
     """A HTTP route.
 
+    The endpoints are looked up when the route is created, so they must be
+    defined on the class. An endpoint assigned to an instance after it is
+    created is not used.
+
     Attributes:
+        methods (tuple[str, ...]): the names of the endpoints for each request
+            method.
         protocol (str, optional): the protocol for this route. Defaults to
             http.
+        _endpoints (dict[str, Callable]): maps uppercase request methods,
+            as provided by the ASGI server, to their endpoint.
+        _INTERNAL_SERVER_ERROR_RESPONSE (tuple[int, tuple, bytes]): the
+            rendered status, headers and body of a 500 HTTP response.
+        _METHOD_NOT_ALLOWED_RESPONSE (tuple[int, tuple, bytes]): the rendered
+            status, headers and body of a 405 HTTP response.
+        _NOT_IMPLEMENTED_RESPONSE (tuple[int, tuple, bytes]): the rendered
+            status, headers and body of a 501 HTTP response.
 
     Example:
         Creating a HTTP route::
@@ -137,7 +180,39 @@ class HttpRoute(Route):
             >>> http_route = HttpRoute("/about")
     """
 
+    methods: tuple[str, ...] = (
+        "get",
+        "head",
+        "post",
+        "put",
+        "delete",
+        "connect",
+        "options",
+        "trace",
+        "patch",
+    )
     protocol: str = "http"
+    _INTERNAL_SERVER_ERROR_RESPONSE: tuple[
+        int, tuple[tuple[bytes, bytes], ...], bytes
+    ] = _render_plain_text(500, b"Internal Server Error")
+    _METHOD_NOT_ALLOWED_RESPONSE: tuple[
+        int, tuple[tuple[bytes, bytes], ...], bytes
+    ] = _render_plain_text(405, b"Method Not Allowed")
+    _NOT_IMPLEMENTED_RESPONSE: tuple[
+        int, tuple[tuple[bytes, bytes], ...], bytes
+    ] = _render_plain_text(501, b"Not Implemented")
+
+    def __init__(self, path: str) -> None:
+        """Establish the path and the endpoints for this route.
+
+        Args:
+            path (str): the path for this route.
+        """
+        super().__init__(path)
+
+        self._endpoints: dict[
+            str, Callable[[HttpConnection, Request], Coroutine]
+        ] = {method.upper(): getattr(self, method) for method in self.methods}
 
     async def get(self, connection: HttpConnection, request: Request) -> None:
         """Endpoint for a GET request method.
@@ -268,8 +343,8 @@ class HttpRoute(Route):
             connection (HttpConnection): the connection to send the response
                 to.
         """
-        await connection.send_response(
-            PlainTextResponse(status=500, body=b"Internal Server Error")
+        await self._send_rendered_response(
+            connection, self._INTERNAL_SERVER_ERROR_RESPONSE
         )
 
     async def send_not_implemented(self, connection: HttpConnection) -> None:
@@ -281,8 +356,8 @@ class HttpRoute(Route):
             connection (HttpConnection): the connection to send the response
                 to.
         """
-        await connection.send_response(
-            PlainTextResponse(status=501, body=b"Not Implemented")
+        await self._send_rendered_response(
+            connection, self._NOT_IMPLEMENTED_RESPONSE
         )
 
     async def send_method_not_allowed(
@@ -296,8 +371,8 @@ class HttpRoute(Route):
             connection (HttpConnection): the connection to send the response
                 to.
         """
-        await connection.send_response(
-            PlainTextResponse(status=405, body=b"Method Not Allowed")
+        await self._send_rendered_response(
+            connection, self._METHOD_NOT_ALLOWED_RESPONSE
         )
 
     async def __call__(self, connection: HttpConnection) -> None:
@@ -312,6 +387,7 @@ class HttpRoute(Route):
                 the connection information.
 
         Raises:
+            AttributeError: if there is no endpoint for the request method.
             Exception: re-raises any exception that is raised when receiving or
                 processesing the request.
 
@@ -324,11 +400,14 @@ class HttpRoute(Route):
         """
         await super().__call__(connection)
 
-        try:
-            endpoint = await self.get_endpoint(connection.method.lower())
-        except AttributeError:
+        endpoint = self._endpoints.get(connection.method)
+
+        if endpoint is None:
             await self.send_not_implemented(connection)
-            raise
+            raise AttributeError(
+                f"{type(self).__name__} has no endpoint for the "
+                f"{connection.method} method."
+            )
 
         try:
             request = await connection.receive_request()
@@ -337,6 +416,27 @@ class HttpRoute(Route):
             await self.send_internal_server_error(connection)
             raise
 
+    async def _send_rendered_response(
+        self,
+        connection: HttpConnection,
+        response: tuple[int, tuple[tuple[bytes, bytes], ...], bytes],
+    ) -> None:
+        """Send a response from its rendered status, headers and body.
+
+        New messages, with a new list of headers, are sent for each response
+        as middleware may change a message after it is sent.
+
+        Args:
+            connection (HttpConnection): the connection to send the response
+                to.
+            response (tuple[int, tuple[tuple[bytes, bytes], ...], bytes]): the
+                rendered status, headers and body of the response.
+        """
+        status, headers, body = response
+
+        await connection.send_start(status, list(headers))
+        await connection.send_body(body)
+
 
 class WebSocketRoute(Route):
     """A WebSocket route.
@@ -344,6 +444,10 @@ class WebSocketRoute(Route):
     Attributes:
         protocol (str, optional): the protocol for this route. Defaults to
             websocket.
+        request_types (tuple[str, ...]): the names of the endpoints for each
+            request type.
+        _endpoints (dict[str, Callable]): maps request types to their
+            endpoint.
 
     Example:
         Creating a WebSocket route:
@@ -352,6 +456,22 @@ class WebSocketRoute(Route):
     """
 
     protocol: str = "websocket"
+    request_types: tuple[str, ...] = ("connect", "receive", "disconnect")
+
+    def __init__(self, path: str) -> None:
+        """Establish the path and the endpoints for this route.
+
+        Args:
+            path (str): the path for this route.
+        """
+        super().__init__(path)
+
+        self._endpoints: dict[
+            str, Callable[[WebSocketConnection, Request], Coroutine]
+        ] = {
+            request_type: getattr(self, request_type)
+            for request_type in self.request_types
+        }
 
     async def connect(
         self, connection: WebSocketConnection, request: Request
@@ -417,6 +537,7 @@ class WebSocketRoute(Route):
                 with the connection information.
 
         Raises:
+            AttributeError: if there is no endpoint for the request type.
             Exception: re-raises any exception that is raised when receiving or
                 processesing the request.
 
@@ -431,7 +552,14 @@ class WebSocketRoute(Route):
 
         try:
             request = await connection.receive_request()
-            endpoint = await self.get_endpoint(request.type)
+            endpoint = self._endpoints.get(request.type)
+
+            if endpoint is None:
+                raise AttributeError(
+                    f"{type(self).__name__} has no endpoint for the "
+                    f"{request.type} request type."
+                )
+
             await endpoint(connection, request)
         except Exception:
             await self.send_internal_error(connection)
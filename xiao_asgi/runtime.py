@@ -0,0 +1,34 @@
+"""Helpers for the environment an application runs in.
+
+Functions:
+    install_uvloop: use uvloop for the asyncio event loop.
+"""
+import asyncio
+
+
+def install_uvloop() -> None:
+    """Use uvloop for the asyncio event loop.
+
+    uvloop is not a dependency of xiao asgi and must be installed separately.
+    This should be called before the event loop is created, e.g. when
+    starting a server programmatically. Servers that create their own event
+    loop usually have an option for this instead, e.g.
+    ``uvicorn --loop uvloop``.
+
+    Raises:
+        ImportError: if uvloop is not installed.
+
+    Example:
+        Using uvloop before running a server::
+
+            >>> install_uvloop()
+            >>> asyncio.run(serve(app, config))
+    """
+    try:
+        import uvloop
+    except ImportError as error:
+        raise ImportError(
+            "uvloop must be installed to use it for the event loop."
+        ) from error
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())